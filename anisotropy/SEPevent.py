@@ -322,7 +322,7 @@ class SEPevent:
         pol_ax.get_xaxis().set_visible(False)
         pol_ax.get_yaxis().set_visible(False)
         pol_ax.set_ylim(0,1)
-        pol_arr = np.zeros(len(pol))+1
+        pol_arr = np.ones(len(pol))
         timestamp = pol_times[2] - pol_times[1]
         norm = mpl.colors.Normalize(vmin=0, vmax=180, clip=True)
         mapper = cm.ScalarMappable(norm=norm, cmap=cm.bwr)
@@ -876,7 +876,7 @@ class SEPevent:
         pol_ax.get_xaxis().set_visible(False)
         pol_ax.get_yaxis().set_visible(False)
         pol_ax.set_ylim(0,1)
-        pol_arr = np.zeros(len(pol))+1
+        pol_arr = np.ones(len(pol))
         timestamp = pol_times[2] - pol_times[1]
         norm = mpl.colors.Normalize(vmin=0, vmax=180, clip=True)
         mapper = cm.ScalarMappable(norm=norm, cmap=cm.bwr)
@@ -1249,7 +1249,7 @@ class SEPevent:
         pol_ax.get_xaxis().set_visible(False)
         pol_ax.get_yaxis().set_visible(False)
         pol_ax.set_ylim(0,1)
-        pol_arr = np.zeros(len(pol))+1
+        pol_arr = np.ones(len(pol))
         timestamp = pol_times[2] - pol_times[1]
         norm = mpl.colors.Normalize(vmin=0, vmax=180, clip=True)
         mapper = cm.ScalarMappable(norm=norm, cmap=cm.bwr)
@@ -1513,7 +1513,7 @@ class SEPevent:
         pol_ax.get_xaxis().set_visible(False)
         pol_ax.get_yaxis().set_visible(False)
         pol_ax.set_ylim(0,1)
-        pol_arr = np.zeros(len(pol))+1
+        pol_arr = np.ones(len(pol))
         timestamp = pol_times[2] - pol_times[1]
         norm = mpl.colors.Normalize(vmin=0, vmax=180, clip=True)
         mapper = cm.ScalarMappable(norm=norm, cmap=cm.bwr)
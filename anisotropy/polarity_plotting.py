@@ -105,7 +105,7 @@ def polarity_panel(ax,datetimes,phi_relative,bbox_to_anchor=(0.,0.22,1,1.1),heig
     pol_ax.get_xaxis().set_visible(False)
     pol_ax.get_yaxis().set_visible(False)
     pol_ax.set_ylim(0,1)
-    pol_arr = np.zeros(len(phi_relative))+1
+    pol_arr = np.ones(len(phi_relative))
     timestamp = datetimes[2] - datetimes[1]
     norm = Normalize(vmin=0, vmax=180, clip=True)
     mapper = cm.ScalarMappable(norm=norm, cmap=cm.bwr)
@@ -15,14 +15,13 @@ from sunpy.net import Scraper
 from sunpy.time import TimeRange
 from sunpy.data.data_manager.downloader import ParfiveDownloader
 from mpl_toolkits.axes_grid1.inset_locator import inset_axes
-from matplotlib.colors import LogNorm, Normalize
-from matplotlib import cm
+from matplotlib.colors import LogNorm
 from seppy.loader.wind import wind3dp_load
 from seppy.loader.soho import soho_load
 from seppy.tools import resample_df
 # from other_loaders_py3 import wind_3dp_av_en  #, wind_mfi_loader, ERNE_HED_loader
 
-from multi_inst_plots.other_tools import polarity_rtn, mag_angles, load_goes_xrs, \
+from multi_inst_plots.other_tools import polarity_rtn, polarity_panel, mag_angles, load_goes_xrs, resample_xray, \
     load_solo_stix, plot_goes_xrs, plot_solo_stix, make_fig_axs
 
 
@@ -498,13 +497,13 @@ def make_plot(options):
 
     if options.goes.value:
         if isinstance(df_goes_, pd.DataFrame) and av_stixgoes > 0:
-            df_goes = resample_df(df_goes_, str(60 * av_stixgoes) + "s")
+            df_goes = resample_xray(df_goes_, str(60 * av_stixgoes) + "s")
         else:
             df_goes = df_goes_
         
     if options.stix.value:
         if isinstance(df_stix_, pd.DataFrame) and av_stixgoes > 0:
-            df_stix = resample_df(df_stix_, str(60 * av_stixgoes) + "s")
+            df_stix = resample_xray(df_stix_, str(60 * av_stixgoes) + "s")
         else:
             df_stix = df_stix_
 
@@ -661,25 +660,7 @@ def make_plot(options):
                                              df_mag_pol.BRTN_2.values, r, lat, V=400)
             
             # create an inset axe in the current axe:
-            pol_ax = inset_axes(ax, height="5%", width="100%", loc=9, 
-                                bbox_to_anchor=(0.,0,1,1.1), bbox_transform=ax.transAxes) # center, you can check the different codes in plt.legend?
-            
-            pol_ax.get_xaxis().set_visible(False)
-            pol_ax.get_yaxis().set_visible(False)
-            pol_ax.set_ylim(0, 1)
-            # pol_ax.set_xlim([df_mag_pol.index.values[0], df_mag_pol.index.values[-1]])
-            pol_arr = np.zeros(len(pol)) + 1
-            timestamp = df_mag_pol.index.values[2] - df_mag_pol.index.values[1]
-            norm = Normalize(vmin=0, vmax=180, clip=True)
-            mapper = cm.ScalarMappable(norm=norm, cmap=cm.bwr)
-            
-            pol_ax.bar(df_mag_pol.index.values[(phi_relative>=0) & (phi_relative<180)],
-                       pol_arr[(phi_relative>=0) & (phi_relative<180)],
-                       color=mapper.to_rgba(phi_relative[(phi_relative>=0) & (phi_relative<180)]), width=timestamp)
-            pol_ax.bar(df_mag_pol.index.values[(phi_relative>=180) & (phi_relative<360)],
-                       pol_arr[(phi_relative>=180) & (phi_relative<360)],
-                       color=mapper.to_rgba(np.abs(360-phi_relative[(phi_relative>=180) & (phi_relative<360)])),
-                       width=timestamp)
+            pol_ax = polarity_panel(ax, df_mag_pol.index.values, phi_relative, bbox_to_anchor=(0.,0,1,1.1), height="5%")
             
             pol_ax.set_xlim(options.plot_start, options.plot_end)
         
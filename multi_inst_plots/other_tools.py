@@ -1,26 +1,65 @@
 import numpy as np
 import pandas as pd
 import datetime as dt
+import math
 import os
-import sunpy
+import re
+import warnings
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 
 from matplotlib.colors import Normalize
 from matplotlib import cm
 from matplotlib import ticker
+from matplotlib.collections import PolyCollection
 from mpl_toolkits.axes_grid1.inset_locator import inset_axes
-from stixdcpy.quicklook import LightCurves
-from seppy.tools import resample_df
-from sunpy import timeseries as ts
-from sunpy.net import Fido
-from sunpy.net import attrs as a
 
 from time import sleep
 from copy import deepcopy
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
 
+# resolution used when a figure is saved, on-screen figures keep the matplotlib default
 FIG_DPI = 200
 
+# angle conversion factors
+_DEG2RAD = math.pi/180.0
+_RAD2DEG = 180.0/math.pi
+
+# option names that enable the electron and proton panels for each spacecraft
+PARTICLE_PANEL_OPTIONS = {
+    "L1 (Wind/SOHO)": (("l1_wind_e", "l1_ephin"), ("l1_wind_p", "l1_erne")),
+    "Parker Solar Probe": (("psp_epilo_e", "psp_epihi_e"), ("psp_epilo_p", "psp_epihi_p")),
+    "Solar Orbiter": (("solo_het_e", "solo_ept_e"), ("solo_het_p", "solo_ept_p")),
+    "STEREO": (("ster_het_e", "ster_sept_e"), ("ster_het_p", "ster_sept_p")),
+}
+
+
+@lru_cache(maxsize=1)
+def _get_polarity_kernel():
+    # numba is slow to import and the kernel has to be compiled, so both only happen once polarity is needed
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def _calc_polarity_rtn(Br, Bt, Bn, clat, slat, phi_nominal, zone_edges, zone_pol):
+        n = len(Br)
+        pol = np.empty(n)
+        phi_relative = np.empty(n)
+        for i in prange(n):
+            Bx = Br[i]*clat[i] - Bn[i]*slat[i]
+            #atan2 resolves the quadrant directly, angle in [0, 360)
+            phi = (math.atan2(-Bt[i], Bx)*_RAD2DEG) % 360.0
+            #Turn the origin to the nominal Parker spiral direction
+            phi_rel = (phi - phi_nominal[i]) % 360.0
+            phi_relative[i] = phi_rel
+            if np.isnan(phi_rel):
+                pol[i] = np.nan
+            else:
+                pol[i] = zone_pol[np.searchsorted(zone_edges, phi_rel, side='right')]
+        return pol, phi_relative
+    return _calc_polarity_rtn
+
 
 def polarity_rtn(Br,Bt,Bn,r,lat,V=400,delta_angle=10):
     """
@@ -32,28 +71,24 @@ def polarity_rtn(Br,Bt,Bn,r,lat,V=400,delta_angle=10):
     """
     au = 1.495978707e8 #astronomical units (km)
     omega = 2*np.pi/(25.38*24*60*60) #solar rotation rate (rad/s)
+    n = np.size(Br)
     #Nominal Parker spiral angle at distance r (AU)
-    phi_nominal = np.rad2deg(np.arctan(omega*r*au/V))
-    #Calculating By and Bx from the data (heliographical coordinates, where meridian centered at sc)
-    Bx = Br*np.cos(np.deg2rad(lat)) - Bn*np.sin(np.deg2rad(lat))
-    By = Bt
-    phi_fix = np.zeros(len(Bx))
-    phi_fix[(Bx>0) & (By>0)] = 360.0
-    phi_fix[(Bx<0)] = 180.0
-    phi = np.rad2deg(np.arctan(-By/Bx)) + phi_fix
-    #Turn the origin to the nominal Parker spiral direction
-    phi_relative = phi - phi_nominal
-    phi_relative[phi_relative>360] -= 360
-    phi_relative[phi_relative<0] += 360
-    pol = np.nan*np.zeros(len(Br))
-    
-    pol[((phi_relative>=0) & (phi_relative<=90.-delta_angle)) | ((phi_relative>=270.+delta_angle) & (phi_relative<=360))] = 1
-    pol[(phi_relative>=90.+delta_angle) & (phi_relative<=270.-delta_angle)] = -1
-    pol[((phi_relative>=90.-delta_angle) & (phi_relative<=90.+delta_angle)) | ((phi_relative>=270.-delta_angle) & (phi_relative<=270.+delta_angle))] = 0
-    return pol, phi_relative
-
-
+    phi_nominal = np.broadcast_to(np.arctan(omega*np.asarray(r, dtype=float)*au/V)*_RAD2DEG, n)
+    #Latitude terms for Bx (heliographical coordinates, where meridian centered at sc)
+    lat_rad = np.asarray(lat, dtype=float)*_DEG2RAD
+    clat = np.broadcast_to(np.cos(lat_rad), n)
+    slat = np.broadcast_to(np.sin(lat_rad), n)
+    #Polarity zones of phi_relative; the uncertain zones around 90 and 270 include both of their limits
+    zone_edges = np.array([90.-delta_angle, np.nextafter(90.+delta_angle, np.inf),
+                           270.-delta_angle, np.nextafter(270.+delta_angle, np.inf)])
+    zone_pol = np.array([1., 0., -1., 0., 1.])
+    return _get_polarity_kernel()(np.asarray(Br, dtype=float), np.asarray(Bt, dtype=float), np.asarray(Bn, dtype=float),
+                                  clat, slat, phi_nominal, zone_edges, zone_pol)
+
+
+@lru_cache(maxsize=1)
 def polarity_colorwheel():
+    # The colorwheel does not depend on any input, so it is rendered once and the (read-only) image is cached
     # Generate a figure with a polar projection
     fg = plt.figure(figsize=(1,1))
     ax = fg.add_axes([0.1,0.1,0.8,0.8], projection='polar')
@@ -74,46 +109,61 @@ def polarity_colorwheel():
     ax.tick_params(pad=0,labelsize=8)      #cosmetic changes to tick labels
     ax.spines['polar'].set_visible(False)    #turn off the axis spine.
     ax.grid(False)
+    buffer = BytesIO()
+    fg.savefig(buffer, format="png")
+    plt.close(fg)
+    buffer.seek(0)
+    image = plt.imread(buffer)
+    image.flags.writeable = False
+    return image
 
 
-def polarity_panel(ax,datetimes,phi_relative,bbox_to_anchor=(0.,0.22,1,1.1)):
-    pol_ax = inset_axes(ax, height="8%", width="100%", loc=9,
+def polarity_panel(ax,datetimes,phi_relative,bbox_to_anchor=(0.,0.22,1,1.1),height="8%"):
+    pol_ax = inset_axes(ax, height=height, width="100%", loc=9,
                         bbox_to_anchor=bbox_to_anchor, 
                         bbox_transform=ax.transAxes) # center, you can check the different codes in plt.legend?
     pol_ax.get_xaxis().set_visible(False)
     pol_ax.get_yaxis().set_visible(False)
     pol_ax.set_ylim(0,1)
-    pol_arr = np.zeros(len(phi_relative))+1
-    timestamp = datetimes[2] - datetimes[1]
     norm = Normalize(vmin=0, vmax=180, clip=True)
-    mapper = cm.ScalarMappable(norm=norm, cmap=cm.bwr)
-    pol_ax.bar(datetimes[(phi_relative>=0) & (phi_relative<180)],pol_arr[(phi_relative>=0) & (phi_relative<180)],
-               color=mapper.to_rgba(phi_relative[(phi_relative>=0) & (phi_relative<180)]),width=timestamp)
-    pol_ax.bar(datetimes[(phi_relative>=180) & (phi_relative<360)],pol_arr[(phi_relative>=180) & (phi_relative<360)],
-               color=mapper.to_rgba(np.abs(360-phi_relative[(phi_relative>=180) & (phi_relative<360)])),width=timestamp)
+    # convert the timestamps once; all spacing and edge computations work on these numbers
+    times = mdates.date2num(datetimes)
+    steps = np.diff(times)
+    width = np.median(steps)
+    # fold the angle onto [0, 180] and draw the whole strip as a single artist
+    colors = np.where(phi_relative < 180, phi_relative, 360 - phi_relative)
+    if np.allclose(steps, steps[0]):
+        pol_ax.imshow(colors[None, :], extent=(times[0] - width/2, times[-1] + width/2, 0, 1),
+                      aspect='auto', interpolation='nearest', norm=norm, cmap=cm.bwr)
+    else:
+        # one box of the median width per sample, as with the former bars, so data gaps stay empty
+        boxes = np.empty((len(times), 4, 2))
+        boxes[:, :, 0] = (times - width/2)[:, None] + np.array([0, 0, width, width])
+        boxes[:, :, 1] = [0, 1, 1, 0]
+        pol_ax.add_collection(PolyCollection(boxes, array=colors, norm=norm, cmap=cm.bwr, edgecolors='none'))
+        pol_ax.set_xlim(times[0] - width/2, times[-1] + width/2)
     return pol_ax
 
 
 def mag_angles(B,Br,Bt,Bn):
-    theta = np.arccos(Bn/B)
-    alpha = 90-(180/np.pi*theta)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        alpha = np.arcsin(Bn/B)*_RAD2DEG
+        phi = np.arctan2(Bt, Br)*_RAD2DEG
 
-    r = np.sqrt(Br**2 + Bt**2 + Bn**2)
-    phi = np.arccos(Br/np.sqrt(Br**2 + Bt**2))*180/np.pi
-
-    sel = np.where(Bt < 0)
-    count = len(sel[0])
-    if count > 0:
-        phi[sel] = 2*np.pi - phi[sel]
-    sel = np.where(r <= 0)
-    count = len(sel[0])
-    if count > 0:
-        phi[sel] = 0
+    phi[np.asarray(B) <= 0] = 0
 
     return alpha, phi
 
 
 
+@lru_cache(maxsize=1)
+def _get_fido():
+    # sunpy.net is slow to import, so only load it once it is actually needed
+    from sunpy.net import Fido
+    from sunpy.net import attrs as a
+    return Fido, a
+
+
 def cdaweb_download_fido(dataset, startdate, enddate, path=None, max_conn=5):
     """
     Downloads dataset files via SunPy/Fido from CDAWeb
@@ -137,6 +187,9 @@ def cdaweb_download_fido(dataset, startdate, enddate, path=None, max_conn=5):
     -------
     List of downloaded files
     """
+    import sunpy
+    Fido, a = _get_fido()
+
     trange = a.Time(startdate, enddate)
     cda_dataset = a.cdaweb.Dataset(dataset)
     try:
@@ -162,13 +215,92 @@ def cdaweb_download_fido(dataset, startdate, enddate, path=None, max_conn=5):
 
 
 
+def _minmax_downsample(data, ax):
+    """
+    Reduce a time series to the minimum and maximum of each pixel-wide time bin of ax,
+    so that short spikes stay visible while far fewer points are drawn.
+    Data that already fits into two points per pixel is returned unchanged.
+    """
+    n_bins = max(int(ax.bbox.width), 1)
+    if len(data) <= 2 * n_bins:
+        return data
+    if ax.get_autoscalex_on():
+        span = data.index[-1] - data.index[0]
+    else:
+        xmin, xmax = ax.get_xlim()
+        span = pd.Timedelta(days=xmax - xmin)
+    # whole seconds, so that the rule is also valid for indices with a coarser unit than ns
+    rule = max(span / n_bins, pd.Timedelta(1, "s")).ceil("s")
+    bins = data.resample(rule)
+    data_min = bins.min()
+    data_max = bins.max()
+    # put the maximum half a bin later, so both values are drawn as steps within the same bin
+    data_max.index = data_max.index + rule / 2
+    # empty bins stay as NaN, so that data gaps are not bridged when plotting
+    return pd.concat([data_min, data_max]).sort_index()
+
+
+def _resample_uniform(df, resample, pos_timestamp="center"):
+    """
+    Average a numeric DataFrame that lies on a uniform time grid into bins of length resample,
+    using numpy block means instead of the pandas resampler. Bins and timestamps follow
+    seppy's resample_df (origin 'start'). Returns None if this shortcut does not apply, i.e. if
+    the grid is irregular, resample is not an integer multiple (>1) of the cadence or a column
+    would be treated as an uncertainty by resample_df.
+    """
+    if len(df) < 2 or not all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+        return None
+    if any(keyword in str(col).lower() for col in df.columns for keyword in ("unc", "err", "sigma")):
+        return None
+    steps = np.diff(df.index.values.astype("datetime64[ns]").view(np.int64))
+    step = steps[0]
+    if step <= 0 or np.any(steps != step):
+        return None
+    period = pd.Timedelta(resample)
+    ratio, rest = divmod(period.value, step)
+    if rest or ratio < 2:
+        return None
+
+    values = df.to_numpy(dtype=float)
+    n_full = len(values) // ratio
+    with warnings.catch_warnings():
+        # bins that only contain NaN stay NaN, as with pandas
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        means = np.nanmean(values[:n_full*ratio].reshape(n_full, ratio, -1), axis=1)
+        if n_full*ratio < len(values):
+            means = np.vstack([means, np.nanmean(values[n_full*ratio:], axis=0)])
+
+    index = df.index[::ratio]
+    if pos_timestamp != "start":
+        index = index + period/2
+    return pd.DataFrame(means, index=index, columns=df.columns)
+
+
+def resample_xray(df, resample):
+    """
+    Average STIX or GOES/XRS data into bins of length resample, like seppy's resample_df with
+    its default options. Data on a uniform grid is averaged with numpy block means.
+    """
+    from seppy.tools import resample_df
+
+    df_uniform = _resample_uniform(df, resample)
+    if df_uniform is not None:
+        return df_uniform
+    return resample_df(df, resample=resample)
+
+
 def load_solo_stix(start, end, ltc=True, resample=None):
+    from stixdcpy.quicklook import LightCurves
+    from seppy.tools import resample_df
+
     if end - start > dt.timedelta(7):
         print("STIX loading for more than 7 days not supported, no data was fetched")
         return []
     try:
         lc = LightCurves.from_sdc(start_utc=start, end_utc=end, ltc=ltc)
         df_stix = lc.to_pandas()
+        # drop stray out-of-range timestamps, which would otherwise make resampling create huge numbers of empty bins
+        df_stix = df_stix[(df_stix.index >= start) & (df_stix.index <= end)]
 
         if resample != "0min" and resample is not None:
             df_stix = resample_df(df_stix, resample=resample, pos_timestamp=None)
@@ -182,8 +314,9 @@ def load_solo_stix(start, end, ltc=True, resample=None):
 
 def plot_solo_stix(data, ax, ltc, legends_inside, font_ylabel):
     if isinstance(data, pd.DataFrame):
+        data_plot = _minmax_downsample(data, ax)
         for key in data.keys():
-            ax.plot(data.index, data[key], ds="steps-mid", label=key)
+            ax.plot(data_plot.index, data_plot[key], ds="steps-mid", label=key)
     if ltc:
         title = 'SolO/STIX (light travel time corr.)'
     else:
@@ -197,6 +330,33 @@ def plot_solo_stix(data, ax, ltc, legends_inside, font_ylabel):
     ax.set_yscale('log')
 
 
+def _find_local_goes_files(start, end, path):
+    """
+    Look for GOES/XRS flx1s files in path that cover every day from start to end.
+    Returns (satellite number, list of files) for the largest satellite number
+    with complete coverage, or None if there is no such satellite.
+    """
+    if path is None or not os.path.isdir(path):
+        return None
+    days = [f"{day:%Y%m%d}" for day in pd.date_range(pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize(), freq="D")]
+    local_files = {}
+    # sorting puts the latest file version of a day last, so it is the one that is kept
+    for file in sorted(Path(path).glob("sci_xrsf-l2-flx1s_g*_d*.nc")):
+        match = re.match(r"sci_xrsf-l2-flx1s_g(\d+)_d(\d{8})_", file.name)
+        if not match:
+            continue
+        # empty files are left over from interrupted downloads, remove them so that Fido fetches them again
+        if file.stat().st_size == 0:
+            file.unlink()
+        else:
+            local_files.setdefault(int(match[1]), {})[match[2]] = str(file)
+    complete = [sat for sat, files in local_files.items() if all(day in files for day in days)]
+    if not complete:
+        return None
+    sat = max(complete)
+    return sat, [local_files[sat][day] for day in days]
+
+
 def load_goes_xrs(start, end, man_select=False, resample=None, path=None):
     """
     Load GOES high-cadence XRS data with Fido. Picks largest satellite number available, if none specified.
@@ -210,7 +370,11 @@ def load_goes_xrs(start, end, man_select=False, resample=None, path=None):
       end date in a parse_time-compatible format
     man_select : bool (optional)
       allow manual selection of GOES satellite (print what's available)
-    resample : in
+    resample : str (optional)
+      currently not applied, the data is averaged by the caller (see resample_xray)
+    path : str (optional)
+      local path for storing downloaded data; if it already holds files for the whole
+      time range (and man_select is False), these are loaded without querying Fido
 
     Returns
     -------
@@ -220,57 +384,77 @@ def load_goes_xrs(start, end, man_select=False, resample=None, path=None):
     sat : int
         satellite number for which data was returned
     """
-    
-    result_goes = Fido.search(a.Time(start, end), a.Instrument("XRS"), a.Resolution("flx1s"))
-
-    # No data found
-    if len(result_goes["xrs"]) == 0:
-        print(f"No GOES/XRS data found for {start} - {end}!")
-        df_goes = []
-        sat = ''
-        return df_goes, sat
-
-    # If the user chooses to pick the satellite manually, print out available satellites and prompt
-    if man_select:
-        print(result_goes)
-        sats = tuple(np.unique(result_goes["xrs"]["SatelliteNumber"]).tolist())
-        sleep(1)
-
-        while True:
-            sat = input(f"Choose preferred GOES satellite number {sats}:")
-
-            if sat == '':
-                print("Aborting GOES satellite selection. No data will be plotted.")
-                df_goes = []
-                return df_goes, sat
-            
-            try:
-                sat = int(sat)
-                if sat not in result_goes["xrs"]["SatelliteNumber"]:
+    from sunpy import timeseries as ts
+
+    # files already on disk are used directly, saving the search round-trip to the data providers
+    local_goes = None if man_select else _find_local_goes_files(start, end, path)
+    goes = None
+    if local_goes is not None:
+        sat, file_goes = local_goes
+        print(f"Loading GOES-{sat} XRS data for {start} - {end} from {path}")
+        try:
+            goes = ts.TimeSeries(file_goes, concatenate=True)
+        except Exception:
+            # e.g. a file truncated by an interrupted download, so fetch the data again below
+            print(f"Unable to load the local GOES-{sat} XRS files, fetching them again")
+
+    if goes is None:
+        Fido, a = _get_fido()
+        result_goes = Fido.search(a.Time(start, end), a.Instrument("XRS"), a.Resolution("flx1s"))
+
+        # No data found
+        if len(result_goes["xrs"]) == 0:
+            print(f"No GOES/XRS data found for {start} - {end}!")
+            df_goes = []
+            sat = ''
+            return df_goes, sat
+
+        # If the user chooses to pick the satellite manually, print out available satellites and prompt
+        if man_select:
+            print(result_goes)
+            sats = tuple(np.unique(result_goes["xrs"]["SatelliteNumber"]).tolist())
+            sleep(1)
+
+            while True:
+                sat = input(f"Choose preferred GOES satellite number {sats}:")
+
+                if sat == '':
+                    print("Aborting GOES satellite selection. No data will be plotted.")
+                    df_goes = []
+                    return df_goes, sat
+
+                try:
+                    sat = int(sat)
+                    if sat not in result_goes["xrs"]["SatelliteNumber"]:
+                        print("Not a valid option, try again.")
+                        sleep(1)
+                    else:
+                        break
+
+                except ValueError:
                     print("Not a valid option, try again.")
                     sleep(1)
-                else:
-                    break
 
-            except ValueError:
-                print("Not a valid option, try again.")
-                sleep(1)
-
-    else:
-        sat = int(max(result_goes["xrs"]["SatelliteNumber"]))
+        else:
+            sat = int(max(result_goes["xrs"]["SatelliteNumber"]))
 
-    print(f"Fetching GOES-{sat} XRS data for {start} - {end}")
-    file_goes = Fido.fetch(result_goes["xrs"][result_goes["xrs", "SatelliteNumber"] == sat], path=path)    
+        print(f"Fetching GOES-{sat} XRS data for {start} - {end}")
+        # broken local files are only replaced when they could not be loaded above
+        file_goes = Fido.fetch(result_goes["xrs"][result_goes["xrs", "SatelliteNumber"] == sat], path=path,
+                               overwrite=local_goes is not None)
+        goes = ts.TimeSeries(file_goes, concatenate=True)
 
-    goes = ts.TimeSeries(file_goes, concatenate=True)
     df_goes = goes.to_dataframe()
-    
-    # mask non-zero quality flagged entries as NaN
-    df_goes['xrsa'] = df_goes['xrsa'].mask((df_goes['xrsa_quality'] != 0), other=np.nan)
-    df_goes['xrsb'] = df_goes['xrsb'].mask((df_goes['xrsb_quality'] != 0), other=np.nan)  
 
-    # keep entries that have at least one good quality flag
-    df_goes = df_goes[(df_goes['xrsa_quality'] == 0) | (df_goes['xrsb_quality'] == 0)]     
+    # keep entries inside the requested time range that have at least one good quality flag
+    good = (df_goes['xrsa_quality'] == 0) | (df_goes['xrsb_quality'] == 0)
+    in_range = (df_goes.index >= start) & (df_goes.index <= end)
+    df_goes = df_goes.loc[good & in_range].copy()
+
+    # mask non-zero quality flagged entries as NaN
+    flux = df_goes[['xrsa', 'xrsb']].to_numpy(copy=True)
+    flux[df_goes[['xrsa_quality', 'xrsb_quality']].to_numpy() != 0] = np.nan
+    df_goes[['xrsa', 'xrsb']] = flux
 
     # if resample != "0min" and resample is not None:
     #     df_goes = resample_df(df_goes, resample=resample)
@@ -283,8 +467,9 @@ def plot_goes_xrs(options, data, sat, ax, font_legend):
     peak = 0
     if isinstance(data, pd.DataFrame):
         peak = max(data[["xrsa","xrsb"]].to_numpy().flatten())
+        data_plot = _minmax_downsample(data[["xrsa", "xrsb"]], ax)
         for channel, wavelength in zip(["xrsa", "xrsb"], ["0.5 - 4.0 Å", "1.0 - 8.0 Å"]):
-            ax.plot(data.index, data[channel], ds="steps-mid", label=wavelength)
+            ax.plot(data_plot.index, data_plot[channel], ds="steps-mid", label=wavelength)
         title = f"GOES-{sat}/XRS"
         if options.legends_inside.value == True:
             ax.legend(loc="upper right", title=title, borderaxespad = 0., fontsize = 10)
@@ -337,56 +522,25 @@ def make_fig_axs(options):
         print(f"Plot range exceeds loaded range {options.startdate.value} - {options.enddate.value}")
          
 
-    if options.spacecraft.value == "L1 (Wind/SOHO)":
-        plot_wind_e = options.l1_wind_e.value
-        plot_wind_p = options.l1_wind_p.value
-        plot_ephin = options.l1_ephin.value
-        plot_erne = options.l1_erne.value
-        plot_electrons = plot_wind_e or plot_ephin
-        plot_protons = plot_wind_p or plot_erne
-
-    if options.spacecraft.value == "Parker Solar Probe":
-        plot_epilo_e = options.psp_epilo_e.value
-        plot_epihi_e = options.psp_epihi_e.value
-        plot_epilo_p = options.psp_epilo_p.value
-        plot_epihi_p = options.psp_epihi_p.value
-        plot_electrons = plot_epilo_e or plot_epihi_e
-        plot_protons = plot_epilo_p or plot_epihi_p
+    electron_opts, proton_opts = PARTICLE_PANEL_OPTIONS[options.spacecraft.value]
+    plot_electrons = any(getattr(options, opt).value for opt in electron_opts)
+    plot_protons = any(getattr(options, opt).value for opt in proton_opts)
 
     if options.spacecraft.value == "Solar Orbiter":
-        plot_het_e = options.solo_het_e.value
-        plot_het_p = options.solo_het_p.value
-        plot_ept_e = options.solo_ept_e.value
-        plot_ept_p = options.solo_ept_p.value
-        plot_electrons = plot_het_e or plot_ept_e
-        plot_protons = plot_het_p or plot_ept_p
         plot_radio = False # TODO: remove once RPW is included
 
-    if options.spacecraft.value == "STEREO":
-        plot_het_e = options.ster_het_e.value
-        plot_het_p = options.ster_het_p.value
-        plot_sept_e = options.ster_sept_e.value
-        plot_sept_p = options.ster_sept_p.value
-        plot_electrons = plot_het_e or plot_sept_e
-        plot_protons = plot_het_p or plot_sept_p
-
 
     font_ylabel = 20
     font_legend = 10
 
-    panels = 1*plot_radio + 1*plot_stix + 1*plot_goes + 1*plot_electrons + 1*plot_protons \
-            + 2*plot_mag_angles + 1*plot_mag + 1* plot_Vsw + 1* plot_N + 1* plot_T + 1*plot_Pdyn 
+    # (panel, shown, height ratio) in plotting order; magnetic field angles take two panels
+    panel_spec = [("radio", plot_radio, 2), ("stix", plot_stix, 1), ("goes", plot_goes, 1),
+                  ("electrons", plot_electrons, 2), ("protons", plot_protons, 2), ("mag", plot_mag, 1),
+                  ("mag_alpha", plot_mag_angles, 1), ("mag_phi", plot_mag_angles, 1),
+                  ("T", plot_T, 1), ("p_dyn", plot_Pdyn, 1), ("N", plot_N, 1), ("Vsw", plot_Vsw, 1)]
+    panel_ratios = [ratio for _, shown, ratio in panel_spec if shown]
+    panels = len(panel_ratios)
 
-    panel_ratios = list(np.zeros(panels)+1)
-
-    if plot_radio:
-        panel_ratios[0] = 2
-    if plot_electrons and plot_protons:
-        panel_ratios[0 + 1*plot_radio + 1*plot_stix + 1*plot_goes] = 2
-        panel_ratios[1 + 1*plot_radio + 1*plot_stix + 1*plot_goes] = 2
-    if plot_electrons or plot_protons:    
-        panel_ratios[0 + 1*plot_radio + 1*plot_stix + 1*plot_goes] = 2
-    
     if panels == 3:
         fig, axs = plt.subplots(nrows=panels, sharex=True, figsize=[12, 4*panels])
     else:
@@ -419,7 +573,6 @@ def make_fig_axs(options):
     axs[-1].set_xlim(options.plot_start, options.plot_end)
     fig.subplots_adjust(hspace=0.1)
     fig.patch.set_facecolor('white')
-    fig.set_dpi(FIG_DPI)
 
     if options.spacecraft.value != "STEREO":
         print(f"Plotting {options.spacecraft.value} data for timerange {options.plot_start} - {options.plot_end}")
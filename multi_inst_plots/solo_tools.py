@@ -3,9 +3,6 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 
-from matplotlib.colors import Normalize
-from matplotlib import cm
-from mpl_toolkits.axes_grid1.inset_locator import inset_axes
 from seppy.loader.solo import mag_load
 from seppy.tools import resample_df
 from solo_epd_loader import epd_load, calc_ept_corrected_e, combine_channels
@@ -17,7 +14,7 @@ from sunpy.net import Fido
 from sunpy.timeseries import TimeSeries
 from astropy.constants import e, k_B, m_p
 
-from multi_inst_plots.other_tools import polarity_rtn, mag_angles, load_goes_xrs, load_solo_stix, plot_goes_xrs, plot_solo_stix, make_fig_axs
+from multi_inst_plots.other_tools import polarity_rtn, polarity_panel, mag_angles, load_goes_xrs, resample_xray, load_solo_stix, plot_goes_xrs, plot_solo_stix, make_fig_axs
 
 
 
@@ -335,13 +332,13 @@ def make_plot(options):
 
     if options.goes.value == True:
         if isinstance(df_goes_, pd.DataFrame) and resample_stixgoes > 0:
-            df_goes = resample_df(df_goes_, str(60 * resample_stixgoes) + "s")
+            df_goes = resample_xray(df_goes_, str(60 * resample_stixgoes) + "s")
         else:
             df_goes = df_goes_
         
     if options.stix.value == True:
         if isinstance(df_stix_, pd.DataFrame) and resample_stixgoes > 0:
-            df_stix = resample_df(df_stix_, str(60 * resample_stixgoes) + "s")
+            df_stix = resample_xray(df_stix_, str(60 * resample_stixgoes) + "s")
         else:
             df_stix = df_stix_
 
@@ -625,17 +622,7 @@ def make_plot(options):
             lat = np.interp([t.timestamp() for t in mag_data.index], [t.timestamp() for t in pd.to_datetime(pos.obstime.value)], pos.lat.value)
             pol, phi_relative = polarity_rtn(mag_data.B_RTN_0.values, mag_data.B_RTN_1.values, mag_data.B_RTN_2.values, r, lat, V=400)
             # create an inset axe in the current axe:
-            pol_ax = inset_axes(ax, height="5%", width="100%", loc=9, bbox_to_anchor=(0.,0,1,1.1), bbox_transform=ax.transAxes) # center, you can check the different codes in plt.legend?
-            pol_ax.get_xaxis().set_visible(False)
-            pol_ax.get_yaxis().set_visible(False)
-            pol_ax.set_ylim(0,1)
-            pol_ax.set_xlim([mag_data.index.values[0], mag_data.index.values[-1]])
-            pol_arr = np.zeros(len(pol))+1
-            timestamp = mag_data.index.values[2] - mag_data.index.values[1]
-            norm = Normalize(vmin=0, vmax=180, clip=True)
-            mapper = cm.ScalarMappable(norm=norm, cmap=cm.bwr)
-            pol_ax.bar(mag_data.index.values[(phi_relative>=0) & (phi_relative<180)], pol_arr[(phi_relative>=0) & (phi_relative<180)], color=mapper.to_rgba(phi_relative[(phi_relative>=0) & (phi_relative<180)]), width=timestamp)
-            pol_ax.bar(mag_data.index.values[(phi_relative>=180) & (phi_relative<360)], pol_arr[(phi_relative>=180) & (phi_relative<360)], color=mapper.to_rgba(np.abs(360-phi_relative[(phi_relative>=180) & (phi_relative<360)])), width=timestamp)
+            pol_ax = polarity_panel(ax, mag_data.index.values, phi_relative, bbox_to_anchor=(0.,0,1,1.1), height="5%")
             pol_ax.set_xlim(options.plot_start, options.plot_end)
 
         
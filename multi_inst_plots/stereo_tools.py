@@ -5,9 +5,8 @@ import cdflib
 import sunpy
 
 from matplotlib import pyplot as plt
-from matplotlib import cm
 from mpl_toolkits.axes_grid1.inset_locator import inset_axes
-from matplotlib.colors import LogNorm, Normalize
+from matplotlib.colors import LogNorm
 
 from seppy.loader.stereo import stereo_load
 from seppy.util import resample_df
@@ -16,7 +15,7 @@ from sunpy.coordinates import get_horizons_coord
 from sunpy.coordinates import frames
 
 
-from multi_inst_plots.other_tools import polarity_rtn, mag_angles, load_goes_xrs, load_solo_stix, plot_goes_xrs, plot_solo_stix, make_fig_axs, cdaweb_download_fido
+from multi_inst_plots.other_tools import polarity_rtn, polarity_panel, mag_angles, load_goes_xrs, resample_xray, load_solo_stix, plot_goes_xrs, plot_solo_stix, make_fig_axs, cdaweb_download_fido
 
 
 # define some plot settings
@@ -354,13 +353,13 @@ def make_plot(options):
 
     if options.goes.value == True:
         if isinstance(df_goes_, pd.DataFrame) and resample_stixgoes > 0:
-            df_goes = resample_df(df_goes_, str(60 * resample_stixgoes) + "s")
+            df_goes = resample_xray(df_goes_, str(60 * resample_stixgoes) + "s")
         else:
             df_goes = df_goes_
         
     if options.stix.value == True:
         if isinstance(df_stix_, pd.DataFrame) and resample_stixgoes > 0:
-            df_stix = resample_df(df_stix_, str(60 * resample_stixgoes) + "s")
+            df_stix = resample_xray(df_stix_, str(60 * resample_stixgoes) + "s")
         else:
             df_stix = df_stix_
 
@@ -520,17 +519,7 @@ def make_plot(options):
             lat = np.interp([t.timestamp() for t in df_magplas.index],[t.timestamp() for t in pd.to_datetime(pos.obstime.value)],pos.lat.value)
             pol, phi_relative = polarity_rtn(df_magplas.BFIELDRTN_0.values, df_magplas.BFIELDRTN_1.values, df_magplas.BFIELDRTN_2.values,r,lat,V=400)
             # create an inset axe in the current axe:
-            pol_ax = inset_axes(ax, height="5%", width="100%", loc=9, bbox_to_anchor=(0.,0,1,1.1), bbox_transform=ax.transAxes) # center, you can check the different codes in plt.legend?
-            pol_ax.get_xaxis().set_visible(False)
-            pol_ax.get_yaxis().set_visible(False)
-            pol_ax.set_ylim(0,1)
-            pol_ax.set_xlim([df_magplas.index.values[0], df_magplas.index.values[-1]])
-            pol_arr = np.zeros(len(pol))+1
-            timestamp = df_magplas.index.values[2] - df_magplas.index.values[1]
-            norm = Normalize(vmin=0, vmax=180, clip=True)
-            mapper = cm.ScalarMappable(norm=norm, cmap=cm.bwr)
-            pol_ax.bar(df_magplas.index.values[(phi_relative>=0) & (phi_relative<180)],pol_arr[(phi_relative>=0) & (phi_relative<180)],color=mapper.to_rgba(phi_relative[(phi_relative>=0) & (phi_relative<180)]),width=timestamp)
-            pol_ax.bar(df_magplas.index.values[(phi_relative>=180) & (phi_relative<360)],pol_arr[(phi_relative>=180) & (phi_relative<360)],color=mapper.to_rgba(np.abs(360-phi_relative[(phi_relative>=180) & (phi_relative<360)])),width=timestamp)
+            pol_ax = polarity_panel(ax, df_magplas.index.values, phi_relative, bbox_to_anchor=(0.,0,1,1.1), height="5%")
             pol_ax.set_xlim(options.plot_start, options.plot_end)
 
         i += 1